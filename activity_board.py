@@ -36,7 +36,9 @@ https://github.com/davidsmakerworks/activity-board
 import random
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, unique, auto
+from functools import lru_cache
 from typing import Union, List
 
 import pygame
@@ -74,13 +76,15 @@ class ActivityBoard:
         loop.
 
         States:
-        START -- Draw all doors with optional animated sequence
+        START -- Draw all doors or start the animated intro sequence
+        INTRO -- Animated intro sequence showing doors one by one
         SELECTING -- Choosing a door to open
         IN_PROGRESS -- Activity displayed on screen and in progress
         ALL_REVEALED -- All doors revealed at end of game
         GAME_OVER -- Exiting game
         """
         START = auto()
+        INTRO = auto()
         SELECTING = auto()
         IN_PROGRESS = auto()
         ALL_REVEALED = auto()
@@ -113,6 +117,47 @@ class ActivityBoard:
         RESTART = auto()
         QUIT = auto()
 
+    # Keys and joystick buttons that map directly to an action - keys that
+    # need modifiers and buttons used in combinations are handled separately
+    # in _translate_action()
+    _KEY_ACTIONS = {
+        K_UP: Action.UP,
+        K_w: Action.UP,
+        K_DOWN: Action.DOWN,
+        K_s: Action.DOWN,
+        K_LEFT: Action.LEFT,
+        K_a: Action.LEFT,
+        K_RIGHT: Action.RIGHT,
+        K_d: Action.RIGHT,
+        K_RETURN: Action.OPEN,
+        K_SPACE: Action.OPEN,
+        K_BACKSPACE: Action.RETURN,
+        K_ESCAPE: Action.RETURN,
+        K_HOME: Action.RESTART
+    }
+
+    # Button is an IntEnum so it hashes the same as the raw button number
+    _BUTTON_ACTIONS = {
+        Button.BTN_A: Action.OPEN,
+        Button.BTN_B: Action.RETURN,
+        Button.BTN_START: Action.RESTART
+    }
+
+    # Horizontal and vertical change in door position for each movement
+    _MOVE_DELTAS = {
+        Action.UP: (0, -1),
+        Action.DOWN: (0, 1),
+        Action.LEFT: (-1, 0),
+        Action.RIGHT: (1, 0)
+    }
+
+    # Event types that _translate_action() can turn into an action
+    _ACTION_EVENT_TYPES = frozenset(
+        [KEYDOWN, JOYBUTTONDOWN, JOYBUTTONUP, JOYHATMOTION])
+
+    # Custom event type posted by the timer that drives the intro sequence
+    _INTRO_TICK = USEREVENT + 1
+
     @property
     def num_doors(self) -> int:
         """Returns total number of doors on the board."""
@@ -121,12 +166,12 @@ class ActivityBoard:
     @property
     def door_width(self) -> int:
         """Returns width (in pixels) of one door."""
-        return self._surface.get_width() // self._doors_horiz
+        return self._door_width
 
     @property
     def door_height(self) -> int:
         """Returns height (in pixels) of one door."""
-        return self._surface.get_height() // self._doors_vert
+        return self._door_height
 
     def __init__(
             self, surface: pygame.Surface, config: dict,
@@ -148,7 +193,16 @@ class ActivityBoard:
 
         self._surface_is_display = surface_is_display
 
-        self._bg_color = pygame.Color(config['board']['bg_color'])
+        self._bg_color = self._color(config['board']['bg_color'])
+
+        # Full-screen background is blitted instead of filled when clearing
+        # the surface so that SDL can use a straight copy
+        self._bg_surface = pygame.Surface((surface.get_width(),
+            surface.get_height()))
+        self._bg_surface.fill(self._bg_color)
+
+        if surface_is_display:
+            self._bg_surface = self._bg_surface.convert()
 
         self._width = surface.get_width()
         self._height = surface.get_height()
@@ -159,7 +213,7 @@ class ActivityBoard:
 
         line_spacing = self._config['board']['line_spacing']
 
-        activity_color = pygame.Color(
+        activity_color = self._color(
                 self._config['board']['color']['activity'])
 
         # One full-screen activity renderer for the whole class
@@ -171,22 +225,53 @@ class ActivityBoard:
         self._doors_horiz = doors_horiz
         self._doors_vert = doors_vert
 
+        self._door_width = self._width // doors_horiz
+        self._door_height = self._height // doors_vert
+
+        # Screen position of each door never changes, so build the table of
+        # door rects once instead of calculating coordinates on every draw
+        self._door_rects = [
+            pygame.Rect(
+                (i % doors_horiz) * self._door_width,
+                (i // doors_horiz) * self._door_height,
+                self._door_width,
+                self._door_height)
+            for i in range(self.num_doors)]
+
         self._start_hidden = start_hidden
 
-        self._activities = self._read_activities(config['activity_file'])
-        self._doors = self._build_door_list(
-                self._activities, doors_hidden=start_hidden)
-
-        self._move_sounds = self._build_sound_list(
-                config['board']['sound']['move'])
-        self._open_sounds = self._build_sound_list(
-                config['board']['sound']['open'])
-        self._oops_sounds = self._build_sound_list(
-                config['board']['sound']['oops'])
-        self._start_sounds = self._build_sound_list(
-                config['board']['sound']['start'])
-        self._reveal_all_sounds = self._build_sound_list(
-                config['board']['sound']['reveal_all'])
+        sound_config = config['board']['sound']
+
+        # Reading the activity file and loading the sounds are independent
+        # of each other and mostly waiting on file I/O, so run them in
+        # worker threads while the doors are being built
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            activities_future = executor.submit(
+                    self._read_activities, config['activity_file'])
+
+            move_future = executor.submit(
+                    self._build_sound_list, sound_config['move'])
+            open_future = executor.submit(
+                    self._build_sound_list, sound_config['open'])
+            oops_future = executor.submit(
+                    self._build_sound_list, sound_config['oops'])
+            start_future = executor.submit(
+                    self._build_sound_list, sound_config['start'])
+            reveal_all_future = executor.submit(
+                    self._build_sound_list, sound_config['reveal_all'])
+
+            self._activities = activities_future.result()
+            self._doors = self._build_door_list(
+                    self._activities, doors_hidden=start_hidden)
+
+            self._move_sounds = move_future.result()
+            self._open_sounds = open_future.result()
+            self._oops_sounds = oops_future.result()
+            self._start_sounds = start_future.result()
+            self._reveal_all_sounds = reveal_all_future.result()
+
+        # Indexes of doors that need to be drawn by _draw_updated_doors()
+        self._updated_doors = set()
 
         self._intro_step_time = config['board']['intro_step_time']
 
@@ -196,41 +281,63 @@ class ActivityBoard:
             pygame.mixer.init(buffer=512)
             pygame.init()
 
+        # Time (in milliseconds) when the Back button was pressed, used to
+        # detect holding Back to quit
+        self._back_down_time = None
+
+        # Reserve one mixer channel per sound effect category so playing a
+        # sound doesn't need to search for a free channel, and a new sound
+        # cuts off the previous one in the same category (e.g., fast moves)
+        pygame.mixer.set_num_channels(8)
+        pygame.mixer.set_reserved(5)
+
+        self._move_channel = pygame.mixer.Channel(0)
+        self._open_channel = pygame.mixer.Channel(1)
+        self._oops_channel = pygame.mixer.Channel(2)
+        self._start_channel = pygame.mixer.Channel(3)
+        self._reveal_all_channel = pygame.mixer.Channel(4)
+
         # Joystick is optional - see documentation for controls
-        if pygame.joystick.get_count():
-            self._joystick = pygame.joystick.Joystick(0)
-            self._joystick.init()
+        self._init_joystick()
 
-    def _door_x_coord(self, index: int) -> int:
-        """
-        Calculate and return the screen X coordinate (in pixels) of the door.
-        """
-        return (index % self._doors_horiz) * self.door_width
+        # Only queue the events that can be translated into actions so that
+        # mouse and joystick axis motion don't flood the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(
+            list(ActivityBoard._ACTION_EVENT_TYPES)
+            + [QUIT, ActivityBoard._INTRO_TICK])
 
-    def _door_y_coord(self, index: int) -> int:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _color(name: str) -> pygame.Color:
         """
-        Calculate and return the screen Y coordinate (in pixels) of the door.
+        Returns a pygame Color object for the given color name.
+
+        Colors are cached so that each distinct color in the configuration is
+        only constructed once. The returned object is shared and must not be
+        modified.
         """
-        return (index // self._doors_horiz) * self.door_height
+        return pygame.Color(name)
 
     def _clear_surface(self) -> None:
         """
         Clear the underlying surface by filling with background color.
         """
-        self._surface.fill(self._bg_color)
+        self._surface.blit(self._bg_surface, (0, 0))
 
         if self._surface_is_display:
             pygame.display.update()
 
     def _read_activities(self, file_name: str) -> List[str]:
-        """Read activities from file (one per line)."""
-        activities = []
+        """
+        Read activities from file (one per line).
 
-        with open(file_name, 'r') as activity_file:
-            for line in activity_file:
-                activities.append(line.strip())
+        Blank lines are ignored so that they can't be chosen as an activity.
+        """
+        with open(file_name, 'r', encoding='utf-8') as activity_file:
+            lines = activity_file.read().splitlines()
 
-        return activities
+        return [line.strip() for line in lines if line.strip()]
 
     def _build_sound_list(
             self, sound_files: List[str]) -> List[pygame.mixer.Sound]:
@@ -260,41 +367,68 @@ class ActivityBoard:
 
         door_colors = self._config['door']['color']
 
-        for i in range(self.num_doors):
-            activity_font = pygame.font.Font(
-                self._config['door']['font']['activity']['file'],
-                self._config['door']['font']['activity']['size'])
-
-            number_font = pygame.font.Font(
-                self._config['door']['font']['number']['file'],
-                self._config['door']['font']['number']['size'])
-
-            # Individual props object for each door to allow for later
-            # customization
-            props = DoorProperties(
-                bg_color=pygame.Color(self._config['board']['bg_color']),
-                door_color=pygame.Color(door_colors['door']),
-                ellipse_color=pygame.Color(door_colors['ellipse']),
-                number_color=pygame.Color(door_colors['number']),
-                cross_color=pygame.Color(door_colors['cross']),
-                selection_color=pygame.Color(door_colors['selection']),
-                activity_color=pygame.Color(door_colors['activity']),
-                unused_color=pygame.Color(door_colors['unused']),
-                activity_font=activity_font,
-                line_spacing=self._config['door']['line_spacing'],
-                number_font=number_font,
-                border_size=self._config['door']['border_size'],
-                ellipse_margin=self._config['door']['ellipse_margin'],
-                cross_width=self._config['door']['cross_width'],
-                cross_offset=self._config['door']['cross_offset'],
-                open_step_time=self._config['door']['open_step_time'])
-
-            # Choose a random activity for the door
-            activity = random.choice(activities)
-            
-            # Remove the activity from the list to prevent duplicates
-            activities.remove(activity)
+        activity_font = pygame.font.Font(
+            self._config['door']['font']['activity']['file'],
+            self._config['door']['font']['activity']['size'])
+
+        number_font = pygame.font.Font(
+            self._config['door']['font']['number']['file'],
+            self._config['door']['font']['number']['size'])
+
+        # All doors look the same, so one props object (and one pair of
+        # fonts) is shared by every door
+        props = DoorProperties(
+            bg_color=self._color(self._config['board']['bg_color']),
+            door_color=self._color(door_colors['door']),
+            ellipse_color=self._color(door_colors['ellipse']),
+            number_color=self._color(door_colors['number']),
+            cross_color=self._color(door_colors['cross']),
+            selection_color=self._color(door_colors['selection']),
+            activity_color=self._color(door_colors['activity']),
+            unused_color=self._color(door_colors['unused']),
+            activity_font=activity_font,
+            line_spacing=self._config['door']['line_spacing'],
+            number_font=number_font,
+            border_size=self._config['door']['border_size'],
+            ellipse_margin=self._config['door']['ellipse_margin'],
+            cross_width=self._config['door']['cross_width'],
+            cross_offset=self._config['door']['cross_offset'],
+            open_step_time=self._config['door']['open_step_time'])
+
+        for i, activity in enumerate(self._choose_activities(activities)):
+            doors.append(Door(
+                index=i,
+                height=self.door_height,
+                width=self.door_width,
+                activity=activity,
+                props=props,
+                is_hidden=doors_hidden))
+
+        return doors
+
+    def _choose_activities(self, activities: List[str]) -> List[str]:
+        """
+        Choose a random activity for each door.
+
+        Returns a list of activities in door order, with any varied
+        repetitions (e.g., "(5|10|15)") replaced by one of the choices.
+
+        Arguments:
+        activities -- list of activities that can be behind doors (newlines are
+            represented by backticks: `)
+        """
+        if len(activities) < self.num_doors:
+            raise RuntimeError('not enough activities for the number '
+                'of doors')
+
+        # Shuffle a copy of the list so that each door gets a different
+        # random activity without modifying the caller's list
+        pool = list(activities)
+        random.shuffle(pool)
+
+        chosen = []
 
+        for activity in pool[:self.num_doors]:
             # Handle varied repetitions
             if '(' in activity and ')' in activity:
                 # Keep the parentheses for ease of replacing later
@@ -308,19 +442,48 @@ class ActivityBoard:
                 # Replace the string of options with the chosen value
                 activity = activity.replace(rep_string, reps)
 
-            doors.append(Door(
-                index=i,
-                height=self.door_height,
-                width=self.door_width,
-                activity=activity,
-                props=props,
-                is_hidden=doors_hidden))
+            chosen.append(activity)
 
-        return doors
+        return chosen
+
+    def reset(self) -> None:
+        """
+        Prepares the board for a new game.
+
+        The activity file is read again and new random activities are
+        assigned to the existing Door objects, so activities can be updated
+        between plays while door surfaces and other cached drawing data are
+        kept.
+        """
+        self._activities = self._read_activities(
+                self._config['activity_file'])
+
+        for door, activity in zip(
+                self._doors, self._choose_activities(self._activities)):
+            door.reset(activity, is_hidden=self._start_hidden)
+
+        self._updated_doors.clear()
+
+        self._back_down_time = None
 
-    def _play_random_sound(self, sound_list: List[pygame.mixer.Sound]) -> None:
+        # Board is kept between games, so check for a joystick that was
+        # connected since the last game
+        self._init_joystick()
+
+    def _init_joystick(self) -> None:
+        """
+        Opens the first joystick if one is connected.
+        """
+        if pygame.joystick.get_count():
+            self._joystick = pygame.joystick.Joystick(0)
+            self._joystick.init()
+
+    def _play_random_sound(
+            self, sound_list: List[pygame.mixer.Sound],
+            channel: pygame.mixer.Channel) -> None:
         """
-        Plays one random sound from a list of pygame Sound objects.
+        Plays one random sound from a list of pygame Sound objects on
+        the specified mixer channel.
 
         This should be used for all sound playback to allow for the possibility
         of adding multiple sounds.
@@ -330,7 +493,7 @@ class ActivityBoard:
         """
         sound = random.choice(sound_list)
 
-        sound.play()
+        channel.play(sound)
 
     def _get_new_selection(self, door: Door, action: Action) -> int:
         """
@@ -346,38 +509,16 @@ class ActivityBoard:
 
         TODO: Change the above to be more consistent.
         """
-        old_index = door.index
-
-        old_index_h = old_index % self._doors_horiz
-        old_index_v = old_index // self._doors_horiz
-
-        new_index_h = old_index_h
-        new_index_v = old_index_v
-
-        if action is ActivityBoard.Action.UP:
-            new_index_v = old_index_v - 1
-        elif action is ActivityBoard.Action.DOWN:
-            new_index_v = old_index_v + 1
-        elif action is ActivityBoard.Action.LEFT:
-            new_index_h = old_index_h - 1
-        elif action is ActivityBoard.Action.RIGHT:
-            new_index_h = old_index_h + 1
+        delta_h, delta_v = ActivityBoard._MOVE_DELTAS.get(action, (0, 0))
 
-        if new_index_h < 0:
-            new_index_h = old_index_h
+        # Clamp to the edges of the board so that moving past an edge leaves
+        # the selection where it was
+        new_index_h = max(0, min(
+            self._doors_horiz - 1, door.index % self._doors_horiz + delta_h))
+        new_index_v = max(0, min(
+            self._doors_vert - 1, door.index // self._doors_horiz + delta_v))
 
-        if new_index_h > self._doors_horiz - 1:
-            new_index_h = old_index_h
-
-        if new_index_v < 0:
-            new_index_v = 0
-
-        if new_index_v > self._doors_vert - 1:
-            new_index_v = old_index_v
-
-        new_index = new_index_v * self._doors_horiz + new_index_h
-
-        return new_index
+        return new_index_v * self._doors_horiz + new_index_h
 
     def _translate_action(
             self, event: pygame.event.Event) -> Union[Action, None]:
@@ -390,31 +531,33 @@ class ActivityBoard:
         Arguments:
         event -- the pygame event to be translated
         """
+        # Fast path for events that can never be translated into an action
+        if event.type not in ActivityBoard._ACTION_EVENT_TYPES:
+            return None
+
         if event.type == JOYBUTTONDOWN:
-            # Button is an IntEnum so compare by value instead of identity
-            if event.button == Button.BTN_A:
-                return ActivityBoard.Action.OPEN
-            elif event.button == Button.BTN_B:
-                return ActivityBoard.Action.RETURN
-            elif event.button == Button.BTN_Y:
+            # Special cases that depend on more than the button itself
+            if event.button == Button.BTN_Y:
                 if self._joystick.get_button(Button.BTN_X):
                     return ActivityBoard.Action.REVEAL
-            elif event.button == Button.BTN_START:
-                return ActivityBoard.Action.RESTART
             elif event.button == Button.BTN_BACK:
-                    timestamp = time.monotonic()
-
-                    pygame.event.clear()
-
-                    # Only return QUIT action if Back button is held for
-                    # at least 2 seconds
-                    while self._joystick.get_button(Button.BTN_BACK):
-                        # Event queue needs to be pumped in order for
-                        # get_button() to update properly
-                        pygame.event.pump()
-                        
-                        if time.monotonic() - timestamp > 2:
-                            return ActivityBoard.Action.QUIT
+                # Remember when Back was pressed so that the hold time can be
+                # checked when it is released. pygame events don't carry a
+                # timestamp, so the time the event is processed is used.
+                self._back_down_time = pygame.time.get_ticks()
+            else:
+                return ActivityBoard._BUTTON_ACTIONS.get(event.button)
+        elif event.type == JOYBUTTONUP:
+            # Only return QUIT action if Back button was held for
+            # at least 2 seconds before being released
+            if (event.button == Button.BTN_BACK
+                    and self._back_down_time is not None):
+                held_time = pygame.time.get_ticks() - self._back_down_time
+
+                self._back_down_time = None
+
+                if held_time >= 2000:
+                    return ActivityBoard.Action.QUIT
         elif event.type == JOYHATMOTION:
             if event.value[0] and event.value[1]:
                 # Diagonal movement not supported
@@ -429,74 +572,82 @@ class ActivityBoard:
                 elif event.value[1] < 0:
                     return ActivityBoard.Action.DOWN
         elif event.type == KEYDOWN:
-            if event.key == K_UP or event.key == K_w:
-                return ActivityBoard.Action.UP
-            elif event.key == K_DOWN or event.key == K_s:
-                return ActivityBoard.Action.DOWN
-            elif event.key == K_LEFT or event.key == K_a:
-                return ActivityBoard.Action.LEFT
-            elif event.key == K_RIGHT or event.key == K_d:
-                return ActivityBoard.Action.RIGHT
-            elif event.key == K_RETURN or event.key == K_SPACE:
-                return ActivityBoard.Action.OPEN
-            elif event.key == K_BACKSPACE or event.key == K_ESCAPE:
-                return ActivityBoard.Action.RETURN
-            elif event.key == K_z and event.mod & KMOD_LSHIFT:
-                return ActivityBoard.Action.REVEAL
-            elif event.key == K_HOME:
-                return ActivityBoard.Action.RESTART
-            elif (event.key == K_q
-                    and event.mod & KMOD_LSHIFT
-                    and event.mod & KMOD_CTRL):
-                return ActivityBoard.Action.QUIT
+            # Special cases that require modifier keys
+            if event.key == K_z:
+                if event.mod & KMOD_LSHIFT:
+                    return ActivityBoard.Action.REVEAL
+            elif event.key == K_q:
+                if event.mod & KMOD_LSHIFT and event.mod & KMOD_CTRL:
+                    return ActivityBoard.Action.QUIT
+            else:
+                return ActivityBoard._KEY_ACTIONS.get(event.key)
         
         return None
 
     def _draw_door(
-            self, door: Door, update_display: bool = True) -> None:
+            self, door: Door, update_display: bool = True) -> pygame.Rect:
         """
         Draws door onto activity board surface.
 
+        Returns the pygame Rect covering the area of the surface that was
+        drawn so that callers can pass it to pygame.display.update().
+
         Arguments:
         door -- the Door object to render
         update_display -- boolean that determines whether the pygame display
             should be updated after drawing. Set to False when drawing
             multiple doors in a loop.
         """
-        door_surface = door.get_door_surface()
+        rect = self._door_rects[door.index]
 
-        self._surface.blit(
-            door_surface,
-            (self._door_x_coord(door.index),
-            self._door_y_coord(door.index)))
+        self._surface.blit(door.get_door_surface(), rect)
 
+        # Only the area covered by the door needs to be copied to the
+        # display rather than the whole screen
         if update_display and self._surface_is_display:
-            pygame.display.update()
+            pygame.display.update(rect)
+
+        return rect
+
+    def _mark_updated(self, door: Door) -> None:
+        """
+        Marks a door as changed so that it will be drawn by the next call
+        to _draw_updated_doors().
+        """
+        self._updated_doors.add(door.index)
 
     def _draw_updated_doors(self) -> None:
         """
-        Draws only doors that are marked as being changed by setting their
-        is_updated property.
+        Draws only doors that have been marked as changed by calling
+        _mark_updated().
+
+        Only the marked doors are visited, so the cost does not depend on
+        the total number of doors on the board.
         """
-        for d in self._doors:
-            if d.is_updated:
-                self._draw_door(d, update_display=False)
-                d.is_updated = False
-    
-        if self._surface_is_display:
-            pygame.display.update()
+        dirty = []
+
+        for index in self._updated_doors:
+            dirty.append(
+                self._draw_door(self._doors[index], update_display=False))
+
+        self._updated_doors.clear()
+
+        # Nothing to copy to the display if no doors were drawn
+        if self._surface_is_display and dirty:
+            pygame.display.update(dirty)
 
     def _draw_all_doors(self) -> None:
         """
         Draws all doors onto activity board surface.
 
         For best performance, keep track of which doors have been updated
-        and call _draw_door() for only those doors.
+        and call _draw_updated_doors() to draw only those doors.
         """
         for d in self._doors:
             self._draw_door(d, update_display=False)
-            d.is_updated = False
-        
+
+        self._updated_doors.clear()
+
         if self._surface_is_display:
             pygame.display.update()
 
@@ -510,7 +661,7 @@ class ActivityBoard:
         """
         activity_surface = self.activity_renderer.render_surface(door.activity)
 
-        self._surface.fill(self._bg_color)
+        self._surface.blit(self._bg_surface, (0, 0))
 
         activity_rect = activity_surface.get_rect()
 
@@ -522,28 +673,69 @@ class ActivityBoard:
         if self._surface_is_display:
             pygame.display.update()
 
-    def _animate_intro(self) -> None:
+    def _start_intro(self) -> None:
         """
-        Runs the animated intro sequence, which shows doors one
+        Starts the animated intro sequence, which shows doors one
         by one in a random order.
+
+        Doors are shown by _intro_step() each time the intro timer posts
+        an _INTRO_TICK event, so the main loop keeps processing input while
+        the intro is running.
         """
         # Doors start hidden, so this is a quick way to clear update flags and
         # blank the screen at the same time
         self._draw_all_doors()
 
-        intro_show_list = list(range(self.num_doors))
+        self._intro_show_list = list(range(self.num_doors))
+        random.shuffle(self._intro_show_list)
 
-        while intro_show_list:
-            intro_show_index = random.choice(intro_show_list)
+        # Timer interval of 0 would disable the timer, so use at least 1 ms
+        pygame.time.set_timer(
+            ActivityBoard._INTRO_TICK,
+            max(1, int(self._intro_step_time * 1000)))
+
+    def _stop_intro(self) -> None:
+        """Cancels the intro timer."""
+        pygame.time.set_timer(ActivityBoard._INTRO_TICK, 0)
+
+    def _intro_step(self, num_steps: int = 1) -> bool:
+        """
+        Shows the next door(s) of the intro sequence.
+
+        All doors shown in one call are drawn with a single display update.
+
+        Returns True once all doors have been shown and the intro
+        timer has been cancelled.
+
+        Arguments:
+        num_steps -- number of doors to show (i.e., number of intro timer
+            ticks that have been received since the last call)
+        """
+        for _ in range(min(num_steps, len(self._intro_show_list))):
+            intro_show_index = self._intro_show_list.pop()
 
             self._doors[intro_show_index].is_hidden = False
-            self._doors[intro_show_index].is_updated = True
+            self._mark_updated(self._doors[intro_show_index])
+
+        self._draw_updated_doors()
 
-            self._draw_updated_doors()
+        if not self._intro_show_list:
+            self._stop_intro()
 
-            intro_show_list.remove(intro_show_index)
+            return True
 
-            time.sleep(self._intro_step_time)
+        return False
+
+    def _select_first_door(self) -> Door:
+        """
+        Marks the first door as selected, draws it, and returns it.
+        """
+        self._doors[0].is_selected = True
+        self._mark_updated(self._doors[0])
+
+        self._draw_updated_doors()
+
+        return self._doors[0]
 
     def _animate_open(self, door: Door) -> None:
         """
@@ -551,17 +743,44 @@ class ActivityBoard:
         pct_open property and calling _draw_door() until the door is fully
         open.
 
+        The animation is driven by elapsed time rather than a fixed sleep
+        between steps, so slower systems skip steps instead of running long.
+        The total duration is the same as 50 steps of open_step_time.
+
         Arguments:
         door -- the Door object to be opened
 
         TODO: Remove magic numbers related to pct_open steps.
         """
-        for i in range(2, 102, 2):
-            door.pct_open = i
+        total_time = 50 * door.props.open_step_time
+
+        clock = pygame.time.Clock()
+
+        start_time = time.monotonic()
+
+        while True:
+            elapsed = time.monotonic() - start_time
 
-            self._draw_door(door)
+            if total_time > 0:
+                # Keep pct_open on the same 2% steps as before
+                pct_open = min(100, int((elapsed / total_time) * 50) * 2)
+            else:
+                pct_open = 100
+
+            # Frames where the door hasn't moved to the next step don't
+            # change anything on screen, so skip drawing them
+            if pct_open != door.pct_open:
+                door.pct_open = pct_open
+
+                self._draw_door(door)
+
+            # Keep the event queue serviced while the animation runs
+            pygame.event.pump()
+
+            if pct_open >= 100:
+                break
 
-            time.sleep(door.props.open_step_time)
+            clock.tick(60)
 
     def _animate_open_all(self) -> None:
         """
@@ -572,20 +791,29 @@ class ActivityBoard:
 
         TODO: Remove magic numbers related to pct_open steps.
         """
+        unopened = []
+
         for d in self._doors:
             if d.is_open:
                 d.is_revealed = True
-                d.is_updated = True
+                self._mark_updated(d)
+            else:
+                unopened.append(d)
 
         self._draw_updated_doors()
 
+        # Only the unopened doors change during the animation, so the same
+        # list of display areas can be updated on every step
+        dirty = [self._door_rects[d.index] for d in unopened]
+
         for i in range(5, 105, 5):
-            for d in self._doors:
-                if not d.is_open:
-                    d.pct_open = i
-                    d.is_updated = True
+            for d in unopened:
+                d.pct_open = i
+
+                self._draw_door(d, update_display=False)
 
-            self._draw_updated_doors()
+            if self._surface_is_display:
+                pygame.display.update(dirty)
 
             # This is unnecessary on Raspberry Pi 3 since the speed is
             # already constrained by the speed of the system
@@ -593,7 +821,7 @@ class ActivityBoard:
 
         for d in self._doors:
             d.is_revealed = True
-            d.is_updated = True
+            self._mark_updated(d)
 
         self._draw_updated_doors()
 
@@ -607,112 +835,145 @@ class ActivityBoard:
         Returns True if the player wants to play again and False if the
         player wants to quit.
 
-        Calling code is responsible for calling run() if the player wants to
-        play again. This is to ensure that configuration and activities
-        can be updated between plays if desired.
+        Calling code is responsible for calling reset() and then run() if the
+        player wants to play again. This is to ensure that activities can be
+        updated between plays if desired.
         """
         self._state = ActivityBoard.State.START
 
         while self._state is not ActivityBoard.State.GAME_OVER:
             if self._state is ActivityBoard.State.START:
-                self._play_random_sound(self._start_sounds)
+                self._play_random_sound(
+                    self._start_sounds, self._start_channel)
 
                 if self._start_hidden:
-                    self._animate_intro()
+                    self._start_intro()
+
+                    self._state = ActivityBoard.State.INTRO
                 else:
                     self._draw_all_doors()
-                
-                self._doors[0].is_selected = True
-                self._doors[0].is_updated = True
-                selected_door = self._doors[0]
 
-                self._draw_updated_doors()
+                    selected_door = self._select_first_door()
 
-                self._state = ActivityBoard.State.SELECTING
+                    self._state = ActivityBoard.State.SELECTING
 
-                pygame.event.clear()
-            elif self._state is ActivityBoard.State.SELECTING:
-                for event in pygame.event.get():
-                    action = self._translate_action(event)
+                    pygame.event.clear()
+            elif self._state is ActivityBoard.State.INTRO:
+                # Intro timer guarantees that an event will arrive, so there
+                # is no need for a timeout here
+                event = pygame.event.wait()
 
-                    if action is ActivityBoard.Action.OPEN:
-                        if not selected_door.is_open:
-                            self._play_random_sound(self._open_sounds)
-                            self._animate_open(selected_door)
-                            self._show_activity(selected_door)
+                if event.type == ActivityBoard._INTRO_TICK:
+                    # If the loop has fallen behind the timer, catch up on
+                    # all pending ticks with one draw instead of one per tick
+                    num_ticks = 1 + len(
+                        pygame.event.get(ActivityBoard._INTRO_TICK))
 
-                            selected_door.is_open = True
+                    if self._intro_step(num_ticks):
+                        selected_door = self._select_first_door()
 
-                            self._state = ActivityBoard.State.IN_PROGRESS
-                        else:
-                            self._play_random_sound(self._oops_sounds)
+                        self._state = ActivityBoard.State.SELECTING
 
                         pygame.event.clear()
-                    elif action is ActivityBoard.Action.RESTART:
+                else:
+                    action = self._translate_action(event)
+
+                    if action is ActivityBoard.Action.RESTART:
+                        self._stop_intro()
+
                         play_again = True
                         self._state = ActivityBoard.State.GAME_OVER
-
-                        pygame.event.clear()
                     elif action is ActivityBoard.Action.QUIT:
+                        self._stop_intro()
+
                         play_again = False
                         self._state = ActivityBoard.State.GAME_OVER
+            elif self._state is ActivityBoard.State.SELECTING:
+                # Sleep until an event arrives instead of spinning on the
+                # queue - the timeout keeps the loop waking at about 60 Hz
+                event = pygame.event.wait(16)
 
-                        pygame.event.clear()
-                    elif action is ActivityBoard.Action.REVEAL:
-                        self._play_random_sound(self._reveal_all_sounds)
-                        
-                        self._animate_open_all()
+                if event.type != NOEVENT:
+                    action = self._translate_action(event)
+                else:
+                    action = None
 
-                        self._state = ActivityBoard.State.ALL_REVEALED
+                if action is ActivityBoard.Action.OPEN:
+                    if not selected_door.is_open:
+                        self._play_random_sound(
+                            self._open_sounds, self._open_channel)
+                        self._animate_open(selected_door)
+                        self._show_activity(selected_door)
 
-                        pygame.event.clear()
-                    elif action in [
-                            ActivityBoard.Action.UP,
-                            ActivityBoard.Action.DOWN,
-                            ActivityBoard.Action.LEFT,
-                            ActivityBoard.Action.RIGHT
-                    ]:
-                        new_index = self._get_new_selection(
-                            selected_door, action)
+                        selected_door.is_open = True
 
-                        if new_index != selected_door.index:
-                            selected_door.is_selected = False
-                            selected_door.is_updated = True
+                        self._state = ActivityBoard.State.IN_PROGRESS
+                    else:
+                        self._play_random_sound(
+                            self._oops_sounds, self._oops_channel)
 
-                            self._doors[new_index].is_selected = True
-                            self._doors[new_index].is_updated = True
+                    pygame.event.clear()
+                elif action is ActivityBoard.Action.RESTART:
+                    play_again = True
+                    self._state = ActivityBoard.State.GAME_OVER
+                elif action is ActivityBoard.Action.QUIT:
+                    play_again = False
+                    self._state = ActivityBoard.State.GAME_OVER
+                elif action is ActivityBoard.Action.REVEAL:
+                    self._play_random_sound(
+                        self._reveal_all_sounds, self._reveal_all_channel)
+                    
+                    self._animate_open_all()
+
+                    self._state = ActivityBoard.State.ALL_REVEALED
+
+                    # Discard any input received during the animation
+                    pygame.event.clear()
+                elif action in ActivityBoard._MOVE_DELTAS:
+                    new_index = self._get_new_selection(
+                        selected_door, action)
 
-                            selected_door = self._doors[new_index]
+                    if new_index != selected_door.index:
+                        selected_door.is_selected = False
+                        self._mark_updated(selected_door)
 
-                            self._play_random_sound(self._move_sounds)
+                        self._doors[new_index].is_selected = True
+                        self._mark_updated(self._doors[new_index])
 
-                            self._draw_updated_doors()
-                        
-                        pygame.event.clear()
-            elif self._state is ActivityBoard.State.IN_PROGRESS:
-                for event in pygame.event.get():
-                    action = self._translate_action(event)
+                        selected_door = self._doors[new_index]
 
-                    if action is ActivityBoard.Action.RETURN:
-                        self._draw_all_doors()
+                        self._play_random_sound(
+                            self._move_sounds, self._move_channel)
 
-                        self._state = ActivityBoard.State.SELECTING
+                        self._draw_updated_doors()
+            elif self._state is ActivityBoard.State.IN_PROGRESS:
+                # Nothing is animating here, so a long timeout lets the
+                # process go idle until the player does something
+                event = pygame.event.wait(250)
 
-                        pygame.event.clear()
-            elif self._state is ActivityBoard.State.ALL_REVEALED:
-                 for event in pygame.event.get():
+                if event.type != NOEVENT:
                     action = self._translate_action(event)
+                else:
+                    action = None
 
-                    if action is ActivityBoard.Action.RESTART:
-                        play_again = True
-                        self._state = ActivityBoard.State.GAME_OVER
+                if action is ActivityBoard.Action.RETURN:
+                    self._draw_all_doors()
 
-                        pygame.event.clear()
-                    elif action is ActivityBoard.Action.QUIT:
-                        play_again = False
-                        self._state = ActivityBoard.State.GAME_OVER
+                    self._state = ActivityBoard.State.SELECTING
+            elif self._state is ActivityBoard.State.ALL_REVEALED:
+                event = pygame.event.wait(250)
 
-                        pygame.event.clear()
+                if event.type != NOEVENT:
+                    action = self._translate_action(event)
+                else:
+                    action = None
+
+                if action is ActivityBoard.Action.RESTART:
+                    play_again = True
+                    self._state = ActivityBoard.State.GAME_OVER
+                elif action is ActivityBoard.Action.QUIT:
+                    play_again = False
+                    self._state = ActivityBoard.State.GAME_OVER
             elif self._state is ActivityBoard.State.GAME_OVER:
                 pass
             else:
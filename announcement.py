@@ -44,6 +44,8 @@ class AnnouncementLine:
     color -- text color as a PyGame color object
     center -- determines if line should be centered on the screen
     """
+    __slots__ = ('text', 'size', 'color', 'center')
+
     def __init__(self, text=None, size=0, color=None, center=False):
         self.text = text
         self.size = size
@@ -62,6 +64,8 @@ class Announcement:
     lines -- list of AnnouncementLine objects representing the individual
         lines of the announcement
     """
+    __slots__ = ('start_date', 'end_date', 'lines')
+
     def __init__(self, start_date, end_date, lines=None):
         self.start_date = start_date
         self.end_date = end_date
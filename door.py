@@ -33,13 +33,34 @@ https://github.com/davidsmakerworks/activity-board
 """
 
 
-from typing import Optional 
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import pygame
 
 from text_renderer import TextRenderer
 
 
+@lru_cache(maxsize=16)
+def _blank_surface(
+        width: int, height: int,
+        color: Tuple[int, int, int, int]) -> pygame.Surface:
+    """
+    Returns a surface of the given size filled with the given color.
+
+    Surfaces are cached and shared, so the returned surface must not be
+    modified by the caller.
+    """
+    surf = pygame.Surface((width, height))
+
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+
+    surf.fill(color)
+
+    return surf
+
+
 class DoorProperties:
     """
     Class to contain configurable properties of a Door object.
@@ -48,6 +69,10 @@ class DoorProperties:
 
     All font-related properties are pygame Font objects.
 
+    Doors cache surfaces rendered from these properties (converted to the
+    display pixel format when a display has been set), so the properties
+    should be treated as read-only once the first door has been drawn.
+
     Properties:
     bg_color -- background color of the underlying activity board surface
     door_color -- overall color of the door surface
@@ -93,6 +118,30 @@ class DoorProperties:
         self.cross_offset = cross_offset
         self.open_step_time = open_step_time
 
+        # Rendered door number surfaces, keyed by door number
+        self._number_glyphs = {}
+
+    def get_number_glyph(self, number: int) -> pygame.Surface:
+        """
+        Returns a surface with the door number rendered in number_font and
+        number_color.
+
+        Each number is only rendered once since font rendering is slow. The
+        returned surface is shared and must not be modified by the caller.
+        """
+        glyph = self._number_glyphs.get(number)
+
+        if glyph is None:
+            glyph = self.number_font.render(
+                str(number), True, self.number_color)
+
+            if pygame.display.get_surface() is not None:
+                glyph = glyph.convert_alpha()
+
+            self._number_glyphs[number] = glyph
+
+        return glyph
+
 
 class Door:
     """
@@ -112,9 +161,6 @@ class Door:
     is_hidden -- boolean representing if door is hidden (i.e., not rendered
         when calling draw(); used for animated startup routine)
 
-    is_updated -- boolean repersenting if door has been updated since 
-        the last time it was drawn (must be set manually) - used to improve 
-        performance by minimizing unnecessary surface blits
     pct_open -- integer percentage of door that is currently displayed -
         used for door-opening animation routine
     """
@@ -130,118 +176,366 @@ class Door:
         self.width = width
         self.activity = activity
         self.props = props
-        self.is_selected = is_selected
-        self.is_open = is_open
-        self.is_revealed = is_revealed
-        self.is_hidden = is_hidden
 
-        # All new doors need to be drawn by default
-        self.is_updated = True
+        # Door geometry never changes, so the rects used for drawing are
+        # only calculated once
+        border_size = props.border_size
+
+        self._interior_rect = pygame.Rect(
+            border_size,
+            border_size,
+            width - border_size * 2,
+            height - border_size * 2)
+
+        # Top and bottom strips span the full width; left and right strips
+        # fill the space between them
+        self._border_rects = [
+            pygame.Rect(0, 0, width, border_size),
+            pygame.Rect(0, height - border_size, width, border_size),
+            pygame.Rect(0, border_size, border_size, height - border_size * 2),
+            pygame.Rect(
+                width - border_size, border_size,
+                border_size, height - border_size * 2)]
+
+        self._ellipse_rect = pygame.Rect(
+            props.ellipse_margin,
+            props.ellipse_margin,
+            width - props.ellipse_margin * 2,
+            height - props.ellipse_margin * 2)
+
+        # Closed door interior is drawn once and reused
+        self._closed_template = None
+
+        # Cross shown on opened doors is drawn once and reused
+        self._cross_surface = None
+
+        # Rendered activity text is cached until reset() assigns a new
+        # activity
+        self._activity_surface = None
+        self._unused_activity_surface = None
+        self._activity_pos = (0, 0)
+
+        # Revealed area for each pct_open value used by the animation
+        self._open_rects = {}
+
+        # Door surface is cached and only rebuilt after one of the
+        # properties that affect its appearance has been changed
+        self._cached_surface = None
+        self._needs_redraw = True
+
+        self._is_selected = is_selected
+        self._is_open = is_open
+        self._is_revealed = is_revealed
+        self._is_hidden = is_hidden
 
         # Always assume that a new door starts fully closed
-        self.pct_open = 0
+        self._pct_open = 0
+
+    def reset(self, activity: str, is_hidden: bool = False) -> None:
+        """
+        Returns the door to its initial closed state with a new activity
+        for a new game.
+
+        Cached drawing data that doesn't depend on the activity (e.g., the
+        closed door template) is kept.
+        """
+        self.activity = activity
+
+        self._activity_surface = None
+        self._unused_activity_surface = None
+
+        self._is_selected = False
+        self._is_open = False
+        self._is_revealed = False
+        self._is_hidden = is_hidden
+        self._pct_open = 0
+
+        self._needs_redraw = True
+
+    @property
+    def is_selected(self) -> bool:
+        return self._is_selected
+
+    @is_selected.setter
+    def is_selected(self, value: bool) -> None:
+        if value != self._is_selected:
+            self._is_selected = value
+            self._needs_redraw = True
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    @is_open.setter
+    def is_open(self, value: bool) -> None:
+        if value != self._is_open:
+            self._is_open = value
+            self._needs_redraw = True
+
+    @property
+    def is_revealed(self) -> bool:
+        return self._is_revealed
+
+    @is_revealed.setter
+    def is_revealed(self, value: bool) -> None:
+        if value != self._is_revealed:
+            self._is_revealed = value
+            self._needs_redraw = True
+
+    @property
+    def is_hidden(self) -> bool:
+        return self._is_hidden
+
+    @is_hidden.setter
+    def is_hidden(self, value: bool) -> None:
+        if value != self._is_hidden:
+            self._is_hidden = value
+            self._needs_redraw = True
+
+    @property
+    def pct_open(self) -> int:
+        return self._pct_open
+
+    @pct_open.setter
+    def pct_open(self, value: int) -> None:
+        if value != self._pct_open:
+            self._pct_open = value
+            self._needs_redraw = True
+
+    def _get_cross_surface(self) -> pygame.Surface:
+        """
+        Returns a transparent surface with a cross (X) drawn on it, used to
+        show that the door has already been opened.
+
+        The cross only depends on the door size and the door properties, so
+        it is only drawn the first time it is requested.
+        """
+        if self._cross_surface is None:
+            cross_surface = pygame.Surface(
+                (self.width, self.height), pygame.SRCALPHA)
+
+            color = self.props.cross_color
+            offset = self.props.cross_offset
+            line_width = self.props.cross_width
+
+            pygame.draw.line(
+                cross_surface,
+                color,
+                (offset, offset * 2),
+                (self.width - offset, self.height - offset * 2),
+                line_width)
+
+            pygame.draw.line(
+                cross_surface,
+                color,
+                (offset, self.height - offset * 2),
+                (self.width - offset, offset * 2),
+                line_width)
+
+            if pygame.display.get_surface() is not None:
+                cross_surface = cross_surface.convert_alpha()
+
+            self._cross_surface = cross_surface
+
+        return self._cross_surface
+
+    def _fill_frame(
+            self, surf: pygame.Surface, border_color: pygame.Color,
+            interior_color: Optional[pygame.Color] = None) -> None:
+        """
+        Fills the door surface with a border of border_color around an
+        interior of interior_color.
+
+        Only the border strips are filled with the border color so that no
+        pixel is written twice. If interior_color is None, the interior is
+        left untouched.
+        """
+        if border_color == interior_color:
+            surf.fill(interior_color)
 
-    def _draw_cross(self, surf: pygame.Surface) -> None:
+            return
+
+        for border_rect in self._border_rects:
+            surf.fill(border_color, border_rect)
+
+        if interior_color is not None:
+            surf.fill(interior_color, self._interior_rect)
+
+    def _get_closed_template(self) -> pygame.Surface:
         """
-        Draws a cross (X) on the door surface to show that the door has
-        already been opened.
+        Returns a surface with the closed door (door color, ellipse, and door
+        number) drawn on it.
+
+        The template is only drawn the first time it is requested. Only the
+        area inside the border is used.
+        """
+        if self._closed_template is None:
+            template = pygame.Surface((self.width, self.height))
+
+            if pygame.display.get_surface() is not None:
+                template = template.convert()
+
+            template.fill(self.props.door_color)
+
+            pygame.draw.ellipse(
+                template, self.props.ellipse_color, self._ellipse_rect)
+
+            number_surface = self.props.get_number_glyph(self.index + 1)
+            number_rect = number_surface.get_rect()
+
+            template.blit(
+                number_surface,
+                ((self.width // 2) - (number_rect.width // 2),
+                (self.height // 2) - (number_rect.height // 2)))
+
+            self._closed_template = template
+
+        return self._closed_template
+
+    def _get_open_rect(self, pct_open: int) -> pygame.Rect:
         """
-        pygame.draw.line(
-            surf,
-            self.props.cross_color,
-            (self.props.cross_offset, self.props.cross_offset * 2),
-            (self.width - self.props.cross_offset,
-                self.height - self.props.cross_offset * 2),
-            self.props.cross_width)
-
-        pygame.draw.line(
-            surf,
-            self.props.cross_color,
-            (self.props.cross_offset,
-                self.height - self.props.cross_offset * 2),
-            (self.width - self.props.cross_offset,
-                self.props.cross_offset * 2),
-            self.props.cross_width)
+        Returns the centered rect of the door that is revealed when the
+        door is pct_open percent open.
+
+        Rects are cached by percentage since the animation only steps
+        through a small set of values.
+        """
+        open_rect = self._open_rects.get(pct_open)
+
+        if open_rect is None:
+            # pct_open is an integer, so integer arithmetic gives the same
+            # result without going through float
+            open_width = self.width * pct_open // 100
+            open_height = self.height * pct_open // 100
+
+            x = (self.width - open_width) // 2
+            y = (self.height - open_height) // 2
+
+            open_rect = pygame.Rect(x, y, open_width, open_height)
+
+            self._open_rects[pct_open] = open_rect
+
+        return open_rect
+
+    def _get_activity_surface(self, unused: bool = False) -> pygame.Surface:
+        """
+        Returns a surface with the activity text rendered on it.
+
+        The text is only rendered the first time each variant is requested.
+
+        Arguments:
+        unused -- if True, render in the unused color for an activity that
+            was not opened during the game
+        """
+        if unused:
+            activity_surface = self._unused_activity_surface
+        else:
+            activity_surface = self._activity_surface
+
+        if activity_surface is None:
+            if unused:
+                text_color = self.props.unused_color
+            else:
+                text_color = self.props.activity_color
+
+            activity_renderer = TextRenderer(
+                font=self.props.activity_font,
+                line_spacing=self.props.line_spacing,
+                text_color=text_color)
+
+            activity_surface = activity_renderer.render_surface(self.activity)
+
+            # Both variants are the same size, so the centered position
+            # only needs to be calculated once
+            activity_rect = activity_surface.get_rect()
+
+            self._activity_pos = (
+                (self.width // 2) - (activity_rect.width // 2),
+                (self.height // 2) - (activity_rect.height // 2))
+
+            if unused:
+                self._unused_activity_surface = activity_surface
+            else:
+                self._activity_surface = activity_surface
+
+        return activity_surface
 
     def get_door_surface(self) -> pygame.Surface:
         """
         Build and return a pygame Surface object representing the door in
         its current state based on the Door object properties.
 
+        The surface is cached and only rebuilt if the door has changed since
+        the last call. The returned surface must not be modified by the caller.
+
         TODO: Move some drawing code to separate methods to improve readability.
         """
-        surf = pygame.Surface((self.width, self.height))
+        # Door is hidden - render as blank box. All hidden doors share the
+        # same blank surface, and the door's own surface is left untouched
+        # so it is still valid once the door is shown.
+        if self.is_hidden:
+            return _blank_surface(
+                self.width, self.height, tuple(self.props.bg_color))
 
-        interior_rect = pygame.Rect(
-            self.props.border_size,
-            self.props.border_size,
-            self.width - self.props.border_size * 2,
-            self.height - self.props.border_size * 2)
+        if not self._needs_redraw:
+            return self._cached_surface
 
-        activity_renderer = TextRenderer(
-            font=self.props.activity_font,
-            line_spacing=self.props.line_spacing,
-            text_color=self.props.activity_color)
+        # Surface is allocated once and redrawn in place when the door
+        # changes. Converting it to the display format means that blits to
+        # the display don't need any pixel format conversion.
+        if self._cached_surface is None:
+            self._cached_surface = pygame.Surface((self.width, self.height))
 
-        if self.is_hidden:
-            # Door is hidden - render as blank box
-            surf.fill(self.props.bg_color)
-        elif self.is_open and not self.is_revealed:
+            if pygame.display.get_surface() is not None:
+                self._cached_surface = self._cached_surface.convert()
+
+        surf = self._cached_surface
+
+        # Local aliases for values used repeatedly below, which avoids
+        # going through the property getters and the props attribute chain
+        props = self.props
+        bg_color = props.bg_color
+        is_open = self._is_open
+        is_revealed = self._is_revealed
+        is_selected = self._is_selected
+        pct_open = self._pct_open
+
+        if is_open and not is_revealed:
             # If door has been opened and we are not in the endgame reveal,
             # render door as an X
-            if self.is_selected:
-                surf.fill(self.props.selection_color)
+            if is_selected:
+                border_color = props.selection_color
             else:
-                surf.fill(self.props.bg_color)
+                border_color = bg_color
 
-            surf.fill(self.props.bg_color, interior_rect)
+            self._fill_frame(surf, border_color, bg_color)
 
-            self._draw_cross(surf)
-        elif self.is_revealed:
+            surf.blit(self._get_cross_surface(), (0, 0))
+        elif is_revealed:
             # Endgame reveal - render with standard text color if the door
             # was opened during the game, otherwise render in a distinctive
             # color to show that the door was not opened during the game.
-            if self.is_open:
-                activity_renderer.text_color = self.props.activity_color
-            else:
-                activity_renderer.text_color = self.props.unused_color
-
-            activity_surface = activity_renderer.render_surface(self.activity)
+            activity_surface = self._get_activity_surface(
+                unused=not is_open)
 
-            activity_rect = activity_surface.get_rect()
-
-            surf.fill(self.props.bg_color)
-            surf.blit(
-                activity_surface,
-                ((self.width // 2) - (activity_rect.width // 2),
-                (self.height // 2) - (activity_rect.height // 2)))
+            surf.fill(bg_color)
+            surf.blit(activity_surface, self._activity_pos)
         else:
-            if self.is_selected:
+            if is_selected:
                 # If the door is currently selected, render a box around the
                 # door to indicate this.
-                surf.fill(self.props.selection_color)
+                border_color = props.selection_color
             else:
-                surf.fill(self.props.bg_color)
+                border_color = bg_color
 
-            surf.fill(self.props.door_color, interior_rect)
-
-            ellipse_rect = pygame.Rect(
-                self.props.ellipse_margin,
-                self.props.ellipse_margin,
-                self.width - self.props.ellipse_margin * 2,
-                self.height - self.props.ellipse_margin * 2)
-
-            pygame.draw.ellipse(
-                surf, self.props.ellipse_color, ellipse_rect)
-
-            number_surface = self.props.number_font.render(
-                    str(self.index + 1), True, self.props.number_color)
-            number_rect = number_surface.get_rect()
+            # Interior of a closed door never changes, so only the border is
+            # drawn here and the interior is copied from the template
+            self._fill_frame(surf, border_color)
 
             surf.blit(
-                number_surface,
-                ((self.width // 2) - (number_rect.width // 2),
-                (self.height // 2) - (number_rect.height // 2)))
+                self._get_closed_template(),
+                self._interior_rect.topleft,
+                self._interior_rect)
 
             # If the door is partially "open", reveal a portion of the
             # activity text surface
@@ -249,30 +543,23 @@ class Door:
             # This reveals a rectangular portion based on the pct_open
             # property, where pct_open = 100 represents a door that is
             # completely open.
-            if self.pct_open > 0:
-                activity_small_surface = activity_renderer.render_surface(
-                    self.activity)
-
-                small_rect = activity_small_surface.get_rect()
-
-                open_width = int(self.width * (self.pct_open / 100))
-                open_height = int(self.height * (self.pct_open / 100))
-
-                open_surface = pygame.Surface((self.width, self.height))
+            if pct_open > 0:
+                activity_small_surface = self._get_activity_surface()
 
-                open_surface.fill(self.props.bg_color)
+                open_rect = self._get_open_rect(pct_open)
 
-                open_surface.blit(
-                    activity_small_surface,
-                    ((self.width // 2) - (small_rect.width // 2),
-                    (self.height // 2) - (small_rect.height // 2)))
+                # Clip to the open area and draw the activity directly onto
+                # the door surface instead of building a full-size
+                # intermediate surface and copying part of it
+                prev_clip = surf.get_clip()
+                surf.set_clip(open_rect)
 
-                x = (self.width - open_width) // 2
-                y = (self.height - open_height) // 2
+                surf.fill(bg_color)
+                surf.blit(activity_small_surface, self._activity_pos)
 
-                open_rect = pygame.Rect(x, y, open_width, open_height)
+                surf.set_clip(prev_clip)
 
-                surf.blit(open_surface, (x, y), open_rect)
+        self._needs_redraw = False
 
         return surf
 
@@ -27,7 +27,8 @@ Wrapper to support ActivityBoard and MediaPlayer functionality
 
 Designed to run on Raspberry Pi 3 or Raspberry Pi 4
 
-Requires PyGame 1.9.6 with Python 3.6 or higher (tested on Python 3.7.3)
+Requires PyGame 2.0 or higher with Python 3.7 or higher (tested on
+Python 3.7.3)
 
 TODO: Significant cleanup required
 
@@ -68,26 +69,30 @@ def main():
         fullscreen=activity_config['display']['fullscreen'])
 
     screen_surface = screen.surface
+
+    # Player and board are only created once so that fonts, sounds, and
+    # cached door surfaces are reused between plays
+    player = MediaPlayer(
+        surface=screen_surface,
+        config=media_config,
+        surface_is_display=True)
+
+    board = ActivityBoard(
+        surface=screen_surface,
+        config=activity_config,
+        start_hidden=True,
+        surface_is_display=True)
+
     play_again = True
 
     while True:
         while play_again:
-            player = MediaPlayer(
-                surface=screen_surface,
-                config=media_config,
-                surface_is_display=True)
-
             play_again = player.run()
 
         play_again = True
 
         while play_again:
-            board = ActivityBoard(
-                surface=screen_surface,
-                config=activity_config,
-                start_hidden=True,
-                surface_is_display=True)
-
+            board.reset()
             play_again = board.run()
 
         play_again = True
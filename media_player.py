@@ -30,6 +30,9 @@ Designed to run on Raspberry Pi 3 or Raspberry Pi 4
 
 Requires PyGame with Python 3 (tested on Python 3.7.3)
 
+Uses Pillow or Pillow-SIMD to load photos and orjson to parse announcements
+if installed
+
 https://github.com/davidsmakerworks/media-display
 
 TODO: General cleanup
@@ -41,16 +44,34 @@ TODO: Better format to store announcements(?)
 
 
 import datetime
-import glob
+import fnmatch
+import hashlib
+import io
 import json
 import os
 import random
 import subprocess
 import time
 
+from typing import List, Tuple
+
 import pygame
 import pymongo
 
+# Pillow (ideally the Pillow-SIMD fork) is used to decode and scale photos if
+# it is installed since it is much faster than pygame at both
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# orjson is used to parse the announcement file if it is installed since it
+# is faster than the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Wildcard import used here based on standard pygame code style
 from pygame.locals import *
 
@@ -70,16 +91,34 @@ class MediaPlayer:
         self._config = config
         self._surface_is_display = surface_is_display
 
+        # Screen is always blanked to black before showing anything
+        self._bg_color = pygame.Color('black')
+
+        # Areas of the screen that currently show something other than the
+        # background, which are the only areas that need to be updated when
+        # the screen is blanked. Contents of the screen are unknown at first.
+        self._drawn_rects = [surface.get_rect()]
+
         # This will be used later for photo scaling
         self._width = surface.get_width()
         self._height = surface.get_height()
 
         self._date_fmt = config['date_fmt']
 
+        # ISO dates can be parsed with the much faster fromisoformat()
+        self._date_is_iso = (self._date_fmt == '%Y-%m-%d')
+
         self._photo_path = config['photos']['path']
         self._photo_files = [item.strip() for item in config['photos']['files']]
         self._photo_time = config['photos']['time']
 
+        # Folder used to store copies of photos that have already been
+        # scaled to the screen size. Caching is disabled if not configured.
+        self._photo_cache_path = config['photos'].get('cache_path')
+
+        # Photo list that the cache was last pruned against
+        self._pruned_photos = None
+
         self._video_path = config['videos']['path']
         self._video_files = [item.strip() for item in config['videos']['files']]
         self._video_probability = config['videos']['probability']
@@ -98,42 +137,106 @@ class MediaPlayer:
         self._announcement_probability = config['announcements']['probability']
         self._announcement_line_spacing = config['announcements']['spacing']
 
+        # Parsed announcements and file lists are kept between cycles and
+        # only rebuilt when the source file or folder has changed
+        self._announcements = []
+        self._announcement_key = None
+        self._file_lists = {}
+
+        # Fonts are loaded from file, so each (font, size) pair is only
+        # loaded once and reused for all announcements
+        self._fonts = {}
+
         if not pygame.get_init():
             pygame.init()
 
+        self._init_joystick()
+
+    def _init_joystick(self) -> None:
+        """
+        Opens the first joystick if one is connected.
+        """
         if pygame.joystick.get_count():
             self._joystick = pygame.joystick.Joystick(0)
             self._joystick.init()
 
-    def _show_image(self, filename: str) -> None:
+    def _get_cache_filename(self, filename: str) -> str:
         """
-        Loads an image from the specified file and displays it on the screen.
-        
-        Image is scaled to fill as much of screen as possible.
+        Returns the name of the file used to cache the scaled copy of a
+        photo.
+
+        The name depends on the photo file name, its modification time, and
+        the screen size, so a changed photo or a different screen size
+        never uses a stale copy.
         """
-        img = pygame.image.load(filename)
+        key = '{}:{}:{}x{}'.format(
+            filename, os.stat(filename).st_mtime_ns, self._width, self._height)
 
-        img_height = img.get_height()
-        img_width = img.get_width()
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
-        # If the image isn't already the same size as the screen,
-        # it needs to be scaled
-        if (img_width != self._width
-                or img_height != self._height):
-            # Determine what the height will be if we expand the image to
-            # fill the whole width
-            scaled_height = int(
-                (float(self._width) / img_width) * img_height)
-
-            # If the scaled image is going to be taller than the screen,
-            # then limit the maximum height and scale the width instead
-            if scaled_height > self._height:
-                scaled_height = self._height
-                scaled_width = int(
-                    (float(self._height) / img_height) * img_width)
-            else:
-                scaled_width = self._width
+        return os.path.join(self._photo_cache_path, digest + '.bmp')
+
+    def _get_scaled_size(
+            self, img_width: int, img_height: int) -> Tuple[int, int]:
+        """
+        Returns the size that an image of the specified size needs to be
+        scaled to in order to fill as much of the screen as possible while
+        keeping its aspect ratio.
+        """
+        # If the image is already the same size as the screen,
+        # it doesn't need to be scaled
+        if (img_width == self._width
+                and img_height == self._height):
+            return (img_width, img_height)
+
+        # Compare the aspect ratios of the image and the screen using
+        # integer cross-multiplication. If the image is relatively wider
+        # than the screen, it fills the whole width, otherwise it fills the
+        # whole height.
+        if img_width * self._height >= img_height * self._width:
+            scaled_width = self._width
+            scaled_height = (img_height * self._width) // img_width
+        else:
+            scaled_width = (img_width * self._height) // img_height
+            scaled_height = self._height
+
+        return (scaled_width, scaled_height)
+
+    def _load_image_pil(self, filename: str) -> pygame.Surface:
+        """
+        Loads and scales an image using Pillow.
+        """
+        with Image.open(filename) as im:
+            scaled_size = self._get_scaled_size(im.width, im.height)
+
+            # For JPEG files this lets the decoder skip detail that would
+            # be lost when scaling down anyway
+            im.draft('RGB', scaled_size)
+
+            # pygame can only use the raw pixel data in RGB or RGBA format.
+            # Images with an alpha band or a transparent color (e.g., LA or
+            # palette images with transparency) keep their transparency.
+            if im.mode not in ('RGB', 'RGBA'):
+                if 'A' in im.getbands() or 'transparency' in im.info:
+                    im = im.convert('RGBA')
+                else:
+                    im = im.convert('RGB')
+
+            if im.size != scaled_size:
+                im = im.resize(scaled_size, Image.BILINEAR)
+
+            return pygame.image.frombuffer(im.tobytes(), im.size, im.mode)
+
+    def _load_image_pygame(self, filename: str) -> pygame.Surface:
+        """
+        Loads and scales an image using pygame. Used if Pillow is not
+        installed.
+        """
+        img = pygame.image.load(filename)
+
+        scaled_size = self._get_scaled_size(img.get_width(), img.get_height())
 
+        if img.get_size() != scaled_size:
             img_bitsize = img.get_bitsize()
 
             # transform.smoothscale() can only be used for 24-bit and
@@ -141,28 +244,113 @@ class MediaPlayer:
             # use transform.scale() instead which will be ugly
             # but at least will work
             if img_bitsize in [24, 32]:
-                img = pygame.transform.smoothscale(
-                    img, (scaled_width, scaled_height))
+                img = pygame.transform.smoothscale(img, scaled_size)
             else:
-                img = pygame.transform.scale(
-                    img, (scaled_width, scaled_height))
+                img = pygame.transform.scale(img, scaled_size)
 
-            # Determine where to place the image so it will appear
-            # centered on the screen
-            display_x = (self._width - scaled_width) / 2
-            display_y = (self._height - scaled_height) / 2
+        return img
+
+    def _load_scaled_image(self, filename: str) -> pygame.Surface:
+        """
+        Loads an image from the specified file and scales it to fill as much
+        of the screen as possible.
+
+        If a photo cache folder is configured, the scaled image is saved
+        there as an uncompressed BMP file, and later calls load that copy
+        instead of decoding and scaling the original image again.
+        """
+        if self._photo_cache_path:
+            cache_filename = self._get_cache_filename(filename)
+
+            if os.path.isfile(cache_filename):
+                # Read the whole file with one call instead of letting SDL
+                # read it in small pieces
+                with open(cache_filename, 'rb') as f:
+                    data = io.BytesIO(f.read())
+
+                return pygame.image.load(data, cache_filename)
+
+        if Image is not None:
+            img = self._load_image_pil(filename)
         else:
-            # No scaling was applied, so image is already full-screen
-            display_x = 0
-            display_y = 0
+            img = self._load_image_pygame(filename)
+
+        if self._photo_cache_path:
+            # Save to a temporary file first so that an interrupted save
+            # never leaves a partial file in the cache. A failed save only
+            # means that the photo will be scaled again next time.
+            temp_filename = cache_filename + '.tmp.bmp'
+
+            try:
+                os.makedirs(self._photo_cache_path, exist_ok=True)
+
+                pygame.image.save(img, temp_filename)
+                os.replace(temp_filename, cache_filename)
+            except (OSError, pygame.error):
+                pass
+
+        return img
+
+    def _show_image(self, filename: str) -> None:
+        """
+        Loads an image from the specified file and displays it on the screen.
+        
+        Image is scaled to fill as much of screen as possible.
+        """
+        img = self._load_scaled_image(filename)
+
+        # Photos with transparency need to be drawn over the background
+        has_alpha = bool(img.get_flags() & SRCALPHA)
 
-        # Blank screen before showing photo in case it
-        # doesn't fill the whole screen
-        self._surface.fill(pygame.Color('black'))
-        self._surface.blit(img, (display_x, display_y))
+        # Converting to the display format means the blit is a direct copy.
+        # Images with per-pixel alpha keep it so that they are still blended
+        # with the background.
+        if self._surface_is_display:
+            if has_alpha:
+                img = img.convert_alpha()
+            else:
+                img = img.convert()
+
+        img_width = img.get_width()
+        img_height = img.get_height()
 
+        # Determine where to place the image so it will appear
+        # centered on the screen. If the image is already full-screen,
+        # this is (0, 0).
+        display_x = (self._width - img_width) // 2
+        display_y = (self._height - img_height) // 2
+
+        # Blank the bars at the sides or at the top and bottom of the screen
+        # in case the photo doesn't fill the whole screen. The area covered
+        # by an opaque photo isn't filled since it is overwritten anyway.
+        if has_alpha:
+            self._surface.fill(
+                self._bg_color,
+                (display_x, display_y, img_width, img_height))
+
+        if display_x > 0:
+            self._surface.fill(
+                self._bg_color, (0, 0, display_x, self._height))
+            self._surface.fill(
+                self._bg_color,
+                (display_x + img_width, 0,
+                    self._width - display_x - img_width, self._height))
+
+        if display_y > 0:
+            self._surface.fill(
+                self._bg_color, (0, 0, self._width, display_y))
+            self._surface.fill(
+                self._bg_color,
+                (0, display_y + img_height,
+                    self._width, self._height - display_y - img_height))
+
+        img_rect = self._surface.blit(img, (display_x, display_y))
+
+        # Only the photo and whatever was shown before it have changed
         if self._surface_is_display:
-            pygame.display.update()
+            pygame.display.update(self._drawn_rects + [img_rect])
+
+        self._drawn_rects = [img_rect]
 
     def _show_video(self, filename: str) -> bool:
         """
@@ -175,10 +363,12 @@ class MediaPlayer:
         # Videos will not be scaled - this needs to be done during transcoding
         # Blank screen before showing video in case it doesn't fill the whole
         # screen
-        self._surface.fill(pygame.Color('black'))
+        self._surface.fill(self._bg_color)
 
         if self._surface_is_display:
-            pygame.display.update()
+            pygame.display.update(self._drawn_rects)
+
+        self._drawn_rects = []
 
         proc = subprocess.Popen(
                 ['/usr/bin/omxplayer', '-o', 'hdmi', filename], shell=False)
@@ -186,8 +376,10 @@ class MediaPlayer:
         # Wait for video player process to exit - explicit comparison with None
         # is required to account for when the process returns 0 on completion
         while proc.poll() is None:
-            # Check to see if user has requested to quit
-            if self._check_for_quit():
+            # Check to see if user has requested to quit. Waiting on events
+            # between polls avoids running the CPU at 100% while still
+            # reacting to a quit request immediately.
+            if self._wait_for_quit(0.25):
                 # Kill the omxplayer wrapper script
                 proc.kill()
 
@@ -197,10 +389,7 @@ class MediaPlayer:
                 
                 # Video was interrupted
                 return False
-            
-            # Sleep to avoid running CPU at 100%
-            time.sleep(0.5)
-            
+
         # This might not be necessary, but it's there in case any stray copies
         # of omxplayer.bin are somehow left running
         subprocess.run(['/usr/bin/killall', 'omxplayer.bin'], shell=False)
@@ -208,6 +397,27 @@ class MediaPlayer:
         # Video played to completion
         return True
 
+    def _get_font(self, text_font: str, size: int) -> pygame.font.Font:
+        """
+        Returns a Font object for the specified font file and size.
+
+        Fonts are cached since loading a font file is slow.
+
+        Arguments:
+        text_font -- name of the font file
+        size -- font size in points
+        """
+        key = (text_font, size)
+
+        fnt = self._fonts.get(key)
+
+        if fnt is None:
+            fnt = pygame.font.Font(text_font, size)
+
+            self._fonts[key] = fnt
+
+        return fnt
+
     def _show_announcement(
             self, announcement: Announcement,
             text_font: str, line_spacing: int) -> None:
@@ -222,16 +432,20 @@ class MediaPlayer:
         line_spacing -- space in pixels to place between each line
         """
 
-        # Pre-calculate total height of message for centering
+        # Pre-calculate total height of message for centering. The font
+        # and size of each line are kept so that the render pass doesn't
+        # need to measure the text again.
         total_height = 0
 
+        line_metrics = []
+
         for line in announcement.lines:
             text = line.text
             size = line.size
 
             # Only count lines with text to be rendered
             if text:
-                fnt = pygame.font.Font(text_font, size)
+                fnt = self._get_font(text_font, size)
 
                 # Calculate size of text to be rendered
                 (line_width, line_height) = fnt.size(text)
@@ -239,34 +453,33 @@ class MediaPlayer:
                 total_height = total_height + line_height + line_spacing
             else:
                 # Directly add up "space" elements without using Font object
+                fnt = None
+                line_width = 0
+                line_height = size
+
                 total_height = total_height + size
 
+            line_metrics.append((fnt, line_width, line_height))
+
         # Start at proper position to center whole message on screen
         current_y = (self._height - total_height) / 2
         if current_y < 0:
             current_y = 0
 
         # Blank screen
-        self._surface.fill(pygame.Color('black'))
+        self._surface.fill(self._bg_color)
 
         if self._surface_is_display:
-            pygame.display.update()
+            pygame.display.update(self._drawn_rects)
 
-        # Render each line of text
-        for line in announcement.lines:
-            text = line.text
-            size = line.size
-            color = line.color
-            center = line.center
+        line_rects = []
 
+        # Render each line of text
+        for (line, (fnt, line_width, line_height)) in zip(
+                announcement.lines, line_metrics):
             # Only render text if there is text to be rendered
-            if text:
-                # Create Font object of given size
-                fnt = pygame.font.Font(text_font, size)
-
-                (line_width, line_height) = fnt.size(text)
-
-                if center:
+            if fnt is not None:
+                if line.center:
                     disp_x = (self._width - line_width) / 2
                 else:
                     # TODO: allow for arbitrary X position to be specified in
@@ -277,118 +490,308 @@ class MediaPlayer:
 
                 # Render line of text to a surface and blit it to the
                 # screen buffer
-                line_surface = fnt.render(text, True, color)
-                self._surface.blit(line_surface, (disp_x, disp_y))
+                line_surface = fnt.render(line.text, True, line.color)
+                line_rects.append(
+                    self._surface.blit(line_surface, (disp_x, disp_y)))
 
                 # Allow for spacing between each line
                 current_y = current_y + line_height + line_spacing
             else:
                 # If line is blank (a "space" element in the XML file) then
                 # just advance the position on the screen
-                current_y = current_y + size
+                current_y = current_y + line_height
 
         # If the class's surface is a pygame display, update display after
-        # all lines have been rendered and blitted
+        # all lines have been rendered and blitted. Only the lines of text
+        # need to be updated since the rest of the screen is already blank.
         if self._surface_is_display:
-            pygame.display.update()
+            pygame.display.update(line_rects)
+
+        self._drawn_rects = line_rects
     
+    def _is_quit_event(self, event: pygame.event.Event) -> bool:
+        """Returns True if the event is a request from the user to quit."""
+        if event.type == pygame.KEYDOWN:
+            return event.key == K_ESCAPE
+        elif event.type == pygame.JOYBUTTONDOWN:
+            return event.button == Button.BTN_START
+
+        return False
+
     def _check_for_quit(self) -> bool:
         for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.key == K_ESCAPE:
-                    return True
-            elif event.type == pygame.JOYBUTTONDOWN:
-                if event.button == Button.BTN_START:
-                    return True
+            if self._is_quit_event(event):
+                return True
 
         return False
 
-    def run(self) -> bool:
+    def _wait_for_quit(self, timeout: float) -> bool:
+        """
+        Waits for up to timeout seconds while checking whether the user has
+        requested to quit.
+
+        The wait blocks until an event arrives instead of polling, so a quit
+        request is handled immediately.
+
+        Returns True if the user requested to quit and False if the timeout
+        expired.
+
+        Arguments:
+        timeout -- maximum time to wait in seconds
+        """
+        deadline = time.monotonic() + timeout
+
         while True:
-            # Create 2 empty lists for photo and video filenames
-            photos = []
-            videos = []
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return False
+
+            # Wait at least 1 ms since a timeout of 0 waits forever
+            event = pygame.event.wait(max(1, int(remaining * 1000)))
+
+            if self._is_quit_event(event):
+                return True
+
+    def _parse_date(self, date_str: str) -> datetime.date:
+        """
+        Converts a date string from the announcement data to a date object
+        using the configured date format.
+        """
+        # fromisoformat() is stricter than strptime() (e.g., it requires
+        # zero-padded months and days), so strptime() is still used for
+        # dates that it rejects
+        if self._date_is_iso:
+            try:
+                return datetime.date.fromisoformat(date_str)
+            except ValueError:
+                pass
+
+        return datetime.datetime.strptime(date_str, self._date_fmt).date()
+
+    def _parse_announcements(
+            self, announcement_data: list,
+            current_date: datetime.date) -> List[Announcement]:
+        """
+        Builds a list of Announcement objects from raw announcement data,
+        keeping only announcements that are active on current_date.
+        """
+        announcements = []
+
+        parse_date = self._parse_date
+
+        # Iterate through all root elements
+        for item in announcement_data:
+            # Get start date and end date for announcement
+            ann_start_date = parse_date(item['start_date'])
+            ann_end_date = parse_date(item['end_date'])
+
+            # Only show announcements that are within the
+            # specified date range
+            if (ann_start_date <= current_date 
+                    and ann_end_date >= current_date):
+                ann_temp = Announcement(ann_start_date, ann_end_date)
+                # Iterate through all "line" elements
+                for line in item['lines']:
+                    # "hspace" elements represent blank vertical spaces
+                    if 'hspace' in line:
+                        ann_temp.lines.append(
+                            AnnouncementLine(
+                                "", line['hspace'], (0, 0, 0), False))
+                    else:
+                        # Append each line to the list that represents
+                        # the lines of the announcement
+                        ann_temp.lines.append(
+                            AnnouncementLine(
+                                line['text'], line['size'],
+                                pygame.Color(line['color']),
+                                line['center']))
+
+                # Append each complete announcement to the master list
+                # of announcements
+                announcements.append(ann_temp)
+
+        return announcements
+
+    def _get_announcements(
+            self, current_date: datetime.date) -> List[Announcement]:
+        """
+        Returns the list of announcements that are active on current_date.
+
+        Announcements from MongoDB are fetched every time. Announcements
+        from a file are only parsed again if the file or the date has
+        changed since the last call.
+        """
+        if self._use_mongo_db:
+            try:
+                with pymongo.MongoClient(self._mongo_db_conn_string) as mongo_client:
+                    db = mongo_client[self._mongo_db_name]
+                    coll = db[self._mongo_db_collection]
+
+                    announcement_data = list(coll.find())
+
+                # Cached file data is no longer current once the database
+                # has been used
+                self._announcement_key = None
+
+                return self._parse_announcements(
+                    announcement_data, current_date)
+            except Exception:
+                # Fall back to the announcement file
+                pass
 
-            # Create empty lists for annoucement data
-            announcements = []
-            announcement_data = []
+        key = (os.stat(self._announcement_file).st_mtime_ns, current_date)
 
+        if key != self._announcement_key:
+            with open(self._announcement_file, 'rb') as f:
+                raw_data = f.read()
+
+            if orjson is not None:
+                announcement_data = orjson.loads(raw_data)
+            else:
+                announcement_data = json.loads(raw_data)
+
+            self._announcements = self._parse_announcements(
+                announcement_data, current_date)
+            self._announcement_key = key
+
+        return self._announcements
+
+    def _prune_photo_cache(self, photos: List[str]) -> None:
+        """
+        Deletes cached photos that don't belong to any photo in the list,
+        e.g., copies of photos that have been changed or removed.
+
+        Only files named like cached photos are deleted, so other files in
+        the cache folder are left alone.
+
+        Arguments:
+        photos -- list of all photo files currently in the slideshow
+        """
+        keep = set()
+
+        for photo in photos:
+            try:
+                keep.add(os.path.basename(self._get_cache_filename(photo)))
+            except FileNotFoundError:
+                # Photo was removed since the folder was scanned
+                pass
+
+        try:
+            with os.scandir(self._photo_cache_path) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        for name in names:
+            # Cached photos are named with a 32-digit hex digest, and
+            # interrupted saves can leave temporary files behind
+            digest = name.split('.', 1)[0]
+
+            if (len(digest) != 32
+                    or not all(c in '0123456789abcdef' for c in digest)
+                    or name not in (digest + '.bmp', digest + '.bmp.tmp.bmp')):
+                continue
+
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self._photo_cache_path, name))
+                except OSError:
+                    pass
+
+    def _get_files(self, path: str, wildcards: List[str]) -> List[str]:
+        """
+        Returns a sorted list of files in path matching any of the
+        wildcards. Both uppercase and lowercase extensions are allowed, but
+        not mixed case.
+
+        The folder is only scanned again if its modification time has
+        changed since the last call. A missing folder has no files.
+        """
+        # Photos and videos may share a folder, so the wildcards are part of
+        # the key
+        key = (path, tuple(wildcards))
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            # Nothing is cached so the folder is picked up as soon as it
+            # is created
+            self._file_lists.pop(key, None)
+
+            return []
+
+        cached = self._file_lists.get(key)
+
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        patterns = (
+            [wildcard.upper() for wildcard in wildcards]
+            + [wildcard.lower() for wildcard in wildcards])
+
+        # Read the folder once and match each name against all of the
+        # patterns instead of reading it again for every pattern. Hidden
+        # files are skipped to match the behavior of glob.
+        try:
+            with os.scandir(path) as entries:
+                files = sorted(
+                    entry.path for entry in entries
+                    if not entry.name.startswith('.')
+                    and entry.is_file()
+                    and any(fnmatch.fnmatchcase(entry.name, pattern)
+                        for pattern in patterns))
+        except (FileNotFoundError, NotADirectoryError):
+            # Folder was removed or replaced after it was checked above
+            self._file_lists.pop(key, None)
+
+            return []
+
+        self._file_lists[key] = (mtime, files)
+
+        return files
+
+    def run(self) -> bool:
+        # Something else may have used the screen since the last run
+        self._drawn_rects = [self._surface.get_rect()]
+
+        # Player is kept between runs, so check for a joystick that was
+        # connected since the last run
+        self._init_joystick()
+
+        # Photos may have been changed in place since the last run, which
+        # doesn't change the folder, so the cache is always pruned once
+        self._pruned_photos = None
+
+        # Settings used for every photo are read into locals once
+        photo_time = self._photo_time
+        announcement_time = self._announcement_time
+        announcement_probability = self._announcement_probability
+        announcement_font = self._announcement_font
+        announcement_line_spacing = self._announcement_line_spacing
+        video_probability = self._video_probability
+
+        while True:
             # Get current datetime
             current_date = datetime.datetime.today().date()
 
-            if self._use_mongo_db:
-                try:
-                    with pymongo.MongoClient(self._mongo_db_conn_string) as mongo_client:
-                        db = mongo_client[self._mongo_db_name]
-                        coll = db[self._mongo_db_collection]
+            announcements = self._get_announcements(current_date)
 
-                        announcement_data = list(coll.find())
+            # Find all photos and videos in designated folders based on the
+            # list of extensions
+            photos = self._get_files(self._photo_path, self._photo_files)
 
-                        mongo_success = True
-                except Exception:
-                    mongo_success = False
-            
-            if not self._use_mongo_db or not mongo_success:
-                with open(self._announcement_file, 'r') as f:
-                    announcement_data = json.load(f)
-
-            # Iterate through all root elements
-            for item in announcement_data:
-                # Get start date and end date for announcement
-                ann_start_date = datetime.datetime.strptime(
-                            item['start_date'], self._date_fmt).date()
-                ann_end_date = datetime.datetime.strptime(
-                            item['end_date'], self._date_fmt).date()
-
-                # Only show announcements that are within the
-                # specified date range
-                if (ann_start_date <= current_date 
-                        and ann_end_date >= current_date):
-                    ann_temp = Announcement(ann_start_date, ann_end_date)
-                    # Iterate through all "line" elements
-                    for line in item['lines']:
-                        # "hspace" elements represent blank vertical spaces
-                        if 'hspace' in line:
-                            ann_temp.lines.append(
-                                AnnouncementLine(
-                                    "", line['hspace'], (0, 0, 0), False))
-                        else:
-                            # Append each line to the list that represents
-                            # the lines of the announcement
-                            ann_temp.lines.append(
-                                AnnouncementLine(
-                                    line['text'], line['size'],
-                                    pygame.Color(line['color']),
-                                    line['center']))
-
-                    # Append each complete announcement to the master list
-                    # of announcements
-                    announcements.append(ann_temp)
-
-            # Find all photos in designated folder based on the
-            # list of extensions. Allow for both uppercase and lowercase
-            # extensions, but not mixed case
-            for wildcard in self._photo_files:
-                photos.extend(
-                    glob.glob(os.path.join(self._photo_path, wildcard.upper())))
-                photos.extend(
-                    glob.glob(os.path.join(self._photo_path, wildcard.lower())))
-
-            # Find all videos in designated folder based on the
-            # list of extensions. Allow for both uppercase and lowercase
-            # extensions, but not mixed case
-            for wildcard in self._video_files:
-                videos.extend(
-                    glob.glob(os.path.join(self._video_path, wildcard.upper())))
-                videos.extend(
-                    glob.glob(os.path.join(self._video_path, wildcard.lower())))
-
-            # Display photos in alphabetical order by filename
-            photos.sort()
+            # A new list means the photo folder has changed, so cached copies
+            # of photos that were changed or removed are deleted
+            if self._photo_cache_path and photos is not self._pruned_photos:
+                self._prune_photo_cache(photos)
+
+                self._pruned_photos = photos
+            videos = self._get_files(self._video_path, self._video_files)
 
             # Loop through all photos and insert videos at random. Note that the
-            # contents of the folder will be reparsed each time all of the
-            # photos are displayed, so this provides an opportunity to
+            # folders and announcements are checked for changes each time all
+            # of the photos are displayed, so this provides an opportunity to
             # add/change the contents without restarting the script.
             for photo in photos:
                 # Check to see if user has requested to quit
@@ -397,35 +800,25 @@ class MediaPlayer:
 
                 self._show_image(photo)
 
-                next_time = time.monotonic() + self._photo_time
-                
-                while time.monotonic() < next_time:
-                    # Check to see if user has requested to quit
-                    if self._check_for_quit():
-                        return False
-                    
-                    # Sleep to avoid running CPU at 100%
-                    time.sleep(0.5)
+                # Check to see if user has requested to quit while the
+                # photo is shown
+                if self._wait_for_quit(photo_time):
+                    return False
 
                 # Display announcements based on the specified probability.
                 # Check to be sure we have any announcements to display before
                 # we try to display one.
-                if (random.random() <= self._announcement_probability
+                if (random.random() <= announcement_probability
                         and announcements):
                     self._show_announcement(
                         random.choice(announcements),
-                        self._announcement_font,
-                        self._announcement_line_spacing)
+                        announcement_font,
+                        announcement_line_spacing)
 
-                    next_time = time.monotonic() + self._announcement_time
-
-                    while time.monotonic() < next_time:
-                        # Check to see if user has requested to quit
-                        if self._check_for_quit():
-                            return False
-                        
-                        # Sleep to avoid running CPU at 100%
-                        time.sleep(0.5)
+                    # Check to see if user has requested to quit while the
+                    # announcement is shown
+                    if self._wait_for_quit(announcement_time):
+                        return False
 
                 # Check to see if user has requested to quit
                 if self._check_for_quit():
@@ -434,7 +827,7 @@ class MediaPlayer:
                 # Play videos based on the specified probability.
                 # Check to be sure we have any videos to play before we try
                 # to play one.
-                if (random.random() <= self._video_probability
+                if (random.random() <= video_probability
                         and videos):
                     if not self._show_video(random.choice(videos)):
                         # _show_video() returns False if user requested to
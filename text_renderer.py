@@ -69,34 +69,46 @@ class TextRenderer:
 
         text_surfaces = []
 
-        for line in text_lines:
-            text_surfaces.append(self.font.render(line, True, self.text_color))
-
         total_height = 0
         max_width = 0
 
-        for ts in text_surfaces:
-            size = ts.get_rect()
+        # Measure each line while it is being rendered rather than in a
+        # separate pass over the rendered surfaces
+        for line in text_lines:
+            ts = self.font.render(line, True, self.text_color)
+
+            (width, height) = ts.get_size()
 
-            total_height += size.height
+            total_height += height
 
-            if size.width > max_width:
-                max_width = size.width
+            if width > max_width:
+                max_width = width
+
+            text_surfaces.append((ts, width, height))
 
         total_height += (len(text_surfaces) - 1) * self.line_spacing
 
-        text_surface = pygame.Surface((max_width, total_height))
+        # Background of the text surface is transparent so that it can be
+        # drawn on any background. Converting it to the display format means
+        # that later blits don't need any pixel format conversion.
+        text_surface = pygame.Surface(
+            (max_width, total_height), pygame.SRCALPHA)
 
-        y = 0
+        if pygame.display.get_surface() is not None:
+            text_surface = text_surface.convert_alpha()
 
-        for ts in text_surfaces:
-            line_rect = ts.get_rect()
+        # Each line is centered horizontally. All lines are blitted with a
+        # single blits() call using the sizes measured above.
+        blit_sequence = []
+
+        y = 0
 
-            line_rect.center = (max_width // 2, line_rect.height // 2)
+        for (ts, width, height) in text_surfaces:
+            blit_sequence.append((ts, ((max_width - width) // 2, y)))
 
-            text_surface.blit(ts, ((max_width - line_rect.width) // 2, y))
+            y = y + height + self.line_spacing
 
-            y = y + line_rect.height + self.line_spacing
+        text_surface.blits(blit_sequence, doreturn=False)
 
         return text_surface
 